@@ -2,7 +2,7 @@
 
 import os
 from enum import Enum, auto
-from time import time, sleep
+from time import monotonic, sleep
 import numpy as np
 
 import hebi
@@ -23,8 +23,10 @@ class ContinuousAngleMaps:
     def __init__(self, group: 'Group', offsets):
         self.group = group
         self.group_fbk = hebi.GroupFeedback(group.size)
-        self.angle_offsets: 'npt.NDArray[np.float64]' = np.array(offsets)
+        self.angle_offsets: 'npt.NDArray[np.float64]' = np.array(offsets, dtype=np.float64)
         self.prev_angles: 'npt.NDArray[np.float64]' = np.zeros(group.size, dtype=np.float64)
+        # scratch space for the per-update angle differences
+        self._diffs: 'npt.NDArray[np.float64]' = np.empty(group.size, dtype=np.float64)
 
         self.group.feedback_frequency = 200.0
         base_dir, _ = os.path.split(__file__)
@@ -33,14 +35,19 @@ class ContinuousAngleMaps:
 
     def update(self):
         self.group.get_next_feedback(reuse_fbk=self.group_fbk)
-        diffs = self.group_fbk.position - self.prev_angles
-        self.prev_angles = self.group_fbk.position
-
-        for i, diff in enumerate(diffs):
-            if diff > np.pi:
-                self.angle_offsets[i] -= 2 * np.pi
-            elif diff < -np.pi:
-                self.angle_offsets[i] += 2 * np.pi
+        fbk_position = self.group_fbk.position
+        diffs = np.subtract(fbk_position, self.prev_angles, out=self._diffs)
+        np.copyto(self.prev_angles, fbk_position)
+
+        # bind to locals, this runs for every joint on every update
+        offsets = self.angle_offsets
+        pi = np.pi
+        two_pi = 2 * pi
+        for i, diff in enumerate(diffs.tolist()):
+            if diff > pi:
+                offsets[i] -= two_pi
+            elif diff < -pi:
+                offsets[i] += two_pi
 
     def rebalance(self, home_pose: 'npt.NDArray[np.float64]'):
         """Adjusts angles so they lie within one rotation of the provided
@@ -70,21 +77,22 @@ class LeaderFollowerControlState(Enum):
     EXIT = auto()
 
 
-class LeaderFollowerInputs:
-
-    def __init__(self, reset=False):
-        self.reset = reset
+class LeaderFollowerInputs(typing.NamedTuple):
+    reset: bool = False
 
 
 class LeaderFollowerControl:
     def __init__(self, input_arm: ContinuousAngleMaps, output_arm: 'Arm', output_arm_home: 'list[float] | npt.NDArray[np.float64]', alignment_diffs):
         self.state = LeaderFollowerControlState.STARTUP
-        self.last_input_time = time()
+        self.last_input_time = monotonic()
         self.last_update_time = self.last_input_time
+        self.last_diff_print_time = -np.inf
         self.input_arm = input_arm
 
         self.output_arm = output_arm
         self.output_goal = hebi.arm.Goal(output_arm.size)
+        # unconstrained waypoint velocity, shared by every follow goal
+        self.free_velocity: 'npt.NDArray[np.float64]' = np.full(output_arm.size, np.nan)
         self.output_arm_home = output_arm_home
         # These are calculated later
         self.output_xyz_home: 'npt.NDArray[np.float64]' = np.empty(3, dtype=np.float64)
@@ -92,8 +100,11 @@ class LeaderFollowerControl:
 
         # used later for storing IK results
         self.target_joints: 'npt.NDArray[np.float64]' = np.empty(7, dtype=np.float64)
+        # seed for the next IK solve, warm started from the previous solution
+        self.ik_seed: 'npt.NDArray[np.float64]' = np.empty(7, dtype=np.float64)
 
-        self.allowed_diffs: 'npt.NDArray[np.float64]' = np.array(alignment_diffs, dtype=np.float64)
+        # alignment_diffs are given in degrees, compare against them in radians
+        self.allowed_diffs: 'npt.NDArray[np.float64]' = np.deg2rad(np.asarray(alignment_diffs, dtype=np.float64))
         self._transition_handlers: 'list[Callable[[LeaderFollowerControl, LeaderFollowerControlState], None]]' = []
 
     @property
@@ -156,8 +167,11 @@ class LeaderFollowerControl:
             # MAPS angles need to be kept within [-π, π]
             diff = self.angle_diff
 
-            print(f'Diffs: {np.around(np.rad2deg(diff), decimals=0)}')
-            if np.all(np.rad2deg(np.abs(diff)) <= self.allowed_diffs):
+            # Report the diffs a couple of times a second rather than on every tick
+            if t_now - self.last_diff_print_time >= 0.5:
+                print(f'Diffs: {np.around(np.rad2deg(diff), decimals=0)}')
+                self.last_diff_print_time = t_now
+            if np.all(np.abs(diff) <= self.allowed_diffs):
                 self.transition_to(self.state.ALIGNING)
 
         elif self.state is self.state.ALIGNING:
@@ -182,28 +196,25 @@ class LeaderFollowerControl:
                 rot_target = np.matmul(np.matmul(input_rot, self.input_rot_home.T), self.output_rot_home)
 
                 # Calculate new arm joint angles
-                # seed IK with the last commanded arm position
+                # seed IK with the previous IK solution, which is already
+                # close to the new target between updates
                 # Three objectives:
                 # Cartesian end effector position
                 # End effector orientation
                 # Mean Squared Error between arm joint angles and MAPS input arm angles
                 # result written into target_joints
-
-                ik_angles = self.output_arm.last_feedback.position_command
-                if np.any(np.isnan(ik_angles)):
-                    ik_angles = self.output_arm.last_feedback.position
-
-                self.output_arm.robot_model.solve_inverse_kinematics(ik_angles,
+                self.output_arm.robot_model.solve_inverse_kinematics(self.ik_seed,
                                                                      endeffector_position_objective(xyz_target),
                                                                      endeffector_so3_objective(rot_target),
                                                                      custom_objective(1, self.arm_MAPS_mse, weight=0.1),
                                                                      output=self.target_joints)
+                np.copyto(self.ik_seed, self.target_joints)
 
                 self.output_goal.clear()
                 # change this t value to adjust how "snappy" the output arm is to the input arm's position
                 self.output_goal.add_waypoint(t=0.3,
                                               position=self.target_joints,
-                                              velocity=[np.nan] * self.output_arm.size)
+                                              velocity=self.free_velocity)
                 self.output_arm.set_goal(self.output_goal)
 
     def transition_to(self, state: LeaderFollowerControlState):
@@ -243,6 +254,8 @@ class LeaderFollowerControl:
             self.output_arm.FK(curr_pos,
                                xyz_out=self.output_xyz_home,
                                orientation_out=self.output_rot_home)
+            # start IK from the aligned pose
+            np.copyto(self.ik_seed, curr_pos)
 
         elif state is self.state.EXIT:
             print("TRANSITIONING TO EXIT")
@@ -301,7 +314,7 @@ if __name__ == "__main__":
     # Because we don't need mobileIO for this demo, just initialize this at the beginning
     arm_inputs = LeaderFollowerInputs()
     while leader_follower_control.running:
-        t = time()
+        t = monotonic()
         try:
             leader_follower_control.update(t, arm_inputs)
             leader_follower_control.send()
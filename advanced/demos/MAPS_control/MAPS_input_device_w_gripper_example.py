@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 
 import os
-from time import time, sleep
+import signal
+import threading
+from time import monotonic, sleep
 import numpy as np
 
 import hebi
 from hebi.util import create_mobile_io
 from hebi.arm import Gripper
 
-from .gripper_control import GripperControl, GripperInputs
+from util.realtime_utils import lock_memory, set_thread_realtime
+
+from .gripper_control import GripperControl, parse_gripper_feedback
 
 from .MAPS_input_device_example import ContinuousAngleMaps, LeaderFollowerControl, LeaderFollowerControlState, LeaderFollowerInputs
 
@@ -21,22 +25,14 @@ def parse_mobile_feedback(m: 'MobileIO'):
     if not m.update(0.0):
         return None, None
 
-    if m.get_button_diff(2) == 1:
-        gripper_target = 1.0
-        m.set_axis_value(3, 1.0)
-    elif m.get_button_diff(4) == 1:
-        gripper_target = 0.0
-        m.set_axis_value(3, -1.0)
-    else:
-        # rescale to range [0, 1]
-        gripper_target = (m.get_axis_state(3) + 1.0) / 2.0
+    gripper_inputs = parse_gripper_feedback(m)
 
     reset_arm = False
     if m.get_button_diff(8) == 1:
         reset_arm = True
 
     # Build an input object using the Mobile IO state
-    return LeaderFollowerInputs(reset_arm), GripperInputs(gripper_target)
+    return LeaderFollowerInputs(reset_arm), gripper_inputs
 
 
 def setup_mobile_io(m: 'MobileIO'):
@@ -146,21 +142,31 @@ if __name__ == "__main__":
 
     leader_follower_control._transition_handlers.append(update_ui)
 
+    # Ctrl-C only requests a stop, the loop exits after a complete update/send
+    stop_requested = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_requested.set())
+
+    # Best effort: reduce control loop jitter when running with enough privileges
+    lock_memory()
+    set_thread_realtime()
+
+    # used when there is no new mobile IO feedback
+    no_arm_inputs = LeaderFollowerInputs(False)
+
     last_text_update = 0.0
-    while leader_follower_control.running and gripper_control.running:
-        t = time()
-        try:
-            arm_inputs, gripper_inputs = parse_mobile_feedback(m)
-            if arm_inputs is None:
-                arm_inputs = LeaderFollowerInputs(False)
-            leader_follower_control.update(t, arm_inputs)
-            gripper_control.update(t, gripper_inputs)
-            leader_follower_control.send()
-            gripper_control.send()
-            if leader_follower_control.state == LeaderFollowerControlState.UNALIGNED:
-                if t - last_text_update > 0.1:
-                    last_text_update = t
-                    m.clear_text(blocking=False)
-                    m.add_text(f'Unaligned: {np.around(np.rad2deg(leader_follower_control.angle_diff), decimals=0)}', blocking=False)
-        except KeyboardInterrupt:
-            leader_follower_control.transition_to(LeaderFollowerControlState.EXIT)
+    while leader_follower_control.running and gripper_control.running and not stop_requested.is_set():
+        t = monotonic()
+        arm_inputs, gripper_inputs = parse_mobile_feedback(m)
+        if arm_inputs is None:
+            arm_inputs = no_arm_inputs
+        leader_follower_control.update(t, arm_inputs)
+        gripper_control.update(t, gripper_inputs)
+        leader_follower_control.send()
+        gripper_control.send()
+        if leader_follower_control.state == LeaderFollowerControlState.UNALIGNED:
+            if t - last_text_update > 0.1:
+                last_text_update = t
+                m.clear_text(blocking=False)
+                m.add_text(f'Unaligned: {np.around(np.rad2deg(leader_follower_control.angle_diff), decimals=0)}', blocking=False)
+
+    leader_follower_control.transition_to(LeaderFollowerControlState.EXIT)
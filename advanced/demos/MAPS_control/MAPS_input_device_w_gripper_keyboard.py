@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import os
-from time import time, sleep
+from time import monotonic, sleep
 import numpy as np
 
 import hebi
@@ -79,7 +79,7 @@ if __name__ == "__main__":
     print('--- Press Spacebar to Toggle Gripper ---')
     kb = KBHit()
     while leader_follower_control.running and gripper_control.running:
-        t = time()
+        t = monotonic()
         try:
             if kb.kbhit():
                 c = kb.getch()
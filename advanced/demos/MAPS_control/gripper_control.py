@@ -1,4 +1,4 @@
-from time import time, sleep
+from time import monotonic, sleep
 from enum import Enum, auto
 import hebi
 from hebi.util import create_mobile_io
@@ -17,16 +17,15 @@ class GripperControlState(Enum):
     EXIT = auto()
 
 
-class GripperInputs:
-    def __init__(self, gripper_target):
-        self.gripper_target = gripper_target
+class GripperInputs(typing.NamedTuple):
+    gripper_target: float
 
 
 class GripperControl:
     def __init__(self, gripper: 'Gripper'):
         self.state = GripperControlState.STARTUP
         self.gripper = gripper
-        self.last_input_time = time()
+        self.last_input_time = monotonic()
 
     @property
     def running(self):
@@ -79,22 +78,36 @@ class GripperControl:
         self.state = state
 
 
+def compute_gripper_target(close_diff: int, open_diff: int, grip_axis: float):
+    """Maps the close/open button edges and grip slider to a gripper target.
+
+    Returns the target in the range [0, 1] and the value the grip slider
+    should be snapped to, or None if the slider should be left alone.
+    """
+    if close_diff == 1:
+        return 1.0, 1.0
+    elif open_diff == 1:
+        return 0.0, -1.0
+    # rescale to range [0, 1]
+    return (grip_axis + 1.0) * 0.5, None
+
+
+def parse_gripper_feedback(m: 'MobileIO'):
+    """Builds gripper inputs from an already updated Mobile IO."""
+    gripper_target, axis_value = compute_gripper_target(m.get_button_diff(2), m.get_button_diff(4), m.get_axis_state(3))
+    if axis_value is not None:
+        # don't wait on the device to acknowledge from inside the control loop
+        m.set_axis_value(3, axis_value, blocking=False)
+
+    return GripperInputs(gripper_target)
+
+
 def parse_mobile_feedback(m: 'MobileIO'):
     if not m.update(0.0):
         return None
 
-    if m.get_button_diff(2) == 1:
-        gripper_target = 1.0
-        m.set_axis_value(3, 1.0)
-    elif m.get_button_diff(4) == 1:
-        gripper_target = 0.0
-        m.set_axis_value(3, -1.0)
-    else:
-        # rescale to range [0, 1]
-        gripper_target = (m.get_axis_state(3) + 1.0) / 2.0
-
     # Build an input object using the Mobile IO state
-    return GripperInputs(gripper_target)
+    return parse_gripper_feedback(m)
 
 
 def setup_mobile_io(m: 'MobileIO'):
@@ -137,11 +150,22 @@ if __name__ == '__main__':
     ## Main Control Loop ##
     #######################
 
+    # Nothing in this loop blocks on feedback, so pace it explicitly
+    period = 0.01  # [s]
+    next_t = monotonic()
     while control.running:
-        t = time()
+        t = monotonic()
         try:
             inputs = parse_mobile_feedback(m)
             control.update(t, inputs)
             control.send()
+
+            next_t += period
+            sleep_time = next_t - monotonic()
+            if sleep_time > 0:
+                sleep(sleep_time)
+            else:
+                # overran the period, skip the missed ticks instead of bursting
+                next_t = monotonic()
         except KeyboardInterrupt:
             control.transition_to(GripperControlState.EXIT)
@@ -52,6 +52,7 @@ abort_flag = False
 pending_goal = False
 run_mode = "training"
 goal = arm_api.Goal(arm.size)
+zero_velocity = [0] * arm.size
 
 # Print Instructions
 instructions = """'s' - Add waypoint (stop)
@@ -100,16 +101,16 @@ while not abort_flag:
         # Add waypoint (stop)
         if char == 's':
             print("Stop waypoint added")
-            goal.add_waypoint(t=waypoint_speed + 3.0, position=arm.last_feedback.position, aux=gripper.state, velocity=[0] * arm.size)
+            goal.add_waypoint(t=waypoint_speed + 3.0, position=arm.last_feedback.position, aux=gripper.state, velocity=zero_velocity)
 
         # Add waypoint (stop) and toggle the gripper
         if char == 'g':
             # Add 2 waypoints to allow the gripper to open or close
             print("Stop waypoint added and gripper toggled")
             position = arm.last_feedback.position
-            goal.add_waypoint(t=waypoint_speed + 3.0, position=position, aux=gripper.state, velocity=[0] * arm.size)
+            goal.add_waypoint(t=waypoint_speed + 3.0, position=position, aux=gripper.state, velocity=zero_velocity)
             gripper.toggle()
-            goal.add_waypoint(t=2.0, position=position, aux=gripper.state, velocity=[0] * arm.size)
+            goal.add_waypoint(t=2.0, position=position, aux=gripper.state, velocity=zero_velocity)
 
         # Add waypoint (flow)
         if char == 'f':
@@ -290,15 +290,21 @@ class App:
                              light=[0, 10, 10])
     #binds keys to move camera
 
+    CAMERA_KEYS = [
+        # (key, move, angle)
+        ("<Left>", (-1, 0, 0), 0),
+        ("<Right>", (1, 0, 0), 0),
+        ("<Up>", (0, 1, 0), 0),
+        ("<Down>", (0, -1, 0), 0),
+        ("<w>", (0, 0, 1), 0),
+        ("<s>", (0, 0, -1), 0),
+        ("<e>", (0, 0, 0), -0.314),
+        ("<d>", (0, 0, 0), 0.314),
+    ]
+
     def bind_keys(self):
-        self.window.bind("<Left>", lambda event, move=(-1, 0, 0), angle=0: self.move_camera(move, angle))
-        self.window.bind("<Right>", lambda event, move=(1, 0, 0), angle=0: self.move_camera(move, angle))
-        self.window.bind("<Up>", lambda event, move=(0, 1, 0), angle=0: self.move_camera(move, angle))
-        self.window.bind("<Down>", lambda event, move=(0, -1, 0), angle=0: self.move_camera(move, angle))
-        self.window.bind("<w>", lambda event, move=(0, 0, 1), angle=0: self.move_camera(move, angle))
-        self.window.bind("<s>", lambda event, move=(0, 0, -1), angle=0: self.move_camera(move, angle))
-        self.window.bind("<e>", lambda event, move=(0, 0, 0), angle=-0.314: self.move_camera(move, angle))
-        self.window.bind("<d>", lambda event, move=(0, 0, 0), angle=0.314: self.move_camera(move, angle))
+        for key, move, angle in App.CAMERA_KEYS:
+            self.window.bind(key, lambda event, move=move, angle=angle: self.move_camera(move, angle))
         self.window.bind("<c>", self.center_camera)
 
     #this function repeatedly calls the update function to keep the program up to data ~60Hz (1/60 ~ .016s
@@ -1,29 +1,11 @@
 import hebi
 import numpy
-from time import sleep
+from time import monotonic, sleep
 import random
 
 
-def get_grav_comp_efforts(robot_model, positions, gravityVec):
-    # Normalize gravity vector (to 1g, or 9.8 m/s^2)
-    normed_gravity = gravityVec / numpy.linalg.norm(gravityVec) * 9.81
-
-    jacobians = robot_model.get_jacobians('CoM', positions)
-    # Get torque for each module
-    # comp_torque = J' * wrench_vector
-    # (for each frame, sum this quantity)
-    comp_torque = numpy.zeros((robot_model.dof_count, 1))
-
-    # Wrench vector
-    wrench_vec = numpy.zeros(6)  # For a single frame; this is (Fx/y/z, tau x/y/z)
-    num_frames = robot_model.get_frame_count('CoM')
-
-    for i in range(num_frames):
-        # Add the torques for each joint to support the mass at this frame
-        wrench_vec[0:3] = normed_gravity * robot_model.masses[i]
-        comp_torque += jacobians[i].transpose() * numpy.reshape(wrench_vec, (6, 1))
-
-    return numpy.squeeze(comp_torque)
+# Direction of gravity, used for gravity compensation
+gravity_vec = numpy.array([0.0, 0.0, 1.0])
 
 
 def setup():
@@ -76,8 +58,8 @@ def play_trajectory(group, model, trajectory, fraction=1.0):
     t = 0.0
     period = 0.01
     cmd = hebi.GroupCommand(6)
-    spring_offset = numpy.zeros((1, 6))
-    spring_offset[0, 1] = -9
+    spring_offset = numpy.zeros(6)
+    spring_offset[1] = -9
 
     duration = trajectory.duration
     while (t < duration * fraction):
@@ -85,7 +67,9 @@ def play_trajectory(group, model, trajectory, fraction=1.0):
         pos_cmd, vel_cmd, acc_cmd = trajectory.get_state(t)
         cmd.position = pos_cmd
         cmd.velocity = vel_cmd
-        cmd.effort = numpy.matrix(get_grav_comp_efforts(model, fbk.position, [0.0, 0.0, 1.0]) + spring_offset).A1
+        # The robot model computes gravity compensation efforts natively, which
+        # is much cheaper than summing the per-frame jacobians in Python
+        cmd.effort = model.get_grav_comp_efforts(fbk.position, gravity_vec) + spring_offset
         group.send_command(cmd)
         t = t + period  # TODO: do this better!
 
@@ -144,18 +128,28 @@ def run():
     trajectory = hebi.trajectory.create_trajectory(time, wp.T, vel, acc)
     play_trajectory(group, model, trajectory, 1.0)
 
-    t = 0
     period = 0.01
     fbk = get_fbk(group)
-    while t < 20:
-        cmd = hebi.GroupCommand(6)
-        spring_offset = numpy.zeros((1, 6))
-        spring_offset[0, 1] = -9
-        cmd.position = start_pt
-        cmd.effort = numpy.matrix(get_grav_comp_efforts(model, fbk.position, [0.0, 0.0, 1.0]) + spring_offset).A1
+    # Hold the final position for 20 seconds on a fixed-rate schedule, so the
+    # time spent sending commands does not stretch the hold out
+    cmd = hebi.GroupCommand(6)
+    cmd.position = start_pt
+    spring_offset = numpy.zeros(6)
+    spring_offset[1] = -9
+
+    next_t = monotonic()
+    end_t = next_t + 20.0
+    while next_t < end_t:
+        cmd.effort = model.get_grav_comp_efforts(fbk.position, gravity_vec) + spring_offset
         group.send_command(cmd)
-        sleep(period)
-        t = t + period
+
+        next_t += period
+        sleep_time = next_t - monotonic()
+        if sleep_time > 0:
+            sleep(sleep_time)
+        else:
+            # overran the period, skip the missed ticks instead of bursting
+            next_t = monotonic()
 
     group.stop_log()
 
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 import hebi
-from math import cos, pi, sin
-from time import sleep, time
+import numpy as np
+from math import pi
+from time import monotonic_ns, sleep
 from matplotlib import pyplot as plt
 
 lookup = hebi.Lookup()
@@ -30,19 +31,29 @@ freq = freq_hz * 2.0 * pi  # [rad / sec]
 amp = pi * 0.25           # [rad] (45 degrees)
 
 duration = 4              # [sec]
-start = time()
-t = time() - start
+
+# The commanded trajectory only depends on time, so sample it once up front
+# at the feedback rate and just look up the current sample inside the loop
+feedback_hz = group.feedback_frequency
+ts = np.arange(0.0, duration, 1.0 / feedback_hz)
+# Position command
+positions = amp * np.sin(freq * ts)
+# Velocity command (time derivative of position)
+velocities = freq * amp * np.cos(freq * ts)
+last_sample = len(ts) - 1
+
+start_ns = monotonic_ns()
+t = 0.0
 
 while t < duration:
     # Even though we don't use the feedback, getting feedback conveniently
     # limits the loop rate to the feedback frequency
     group.get_next_feedback(reuse_fbk=group_feedback)
-    t = time() - start
+    t = (monotonic_ns() - start_ns) * 1e-9
 
-    # Position command
-    group_command.position = amp * sin(freq * t)
-    # Velocity command (time derivative of position)
-    group_command.velocity = freq * amp * cos(freq * t)
+    i = min(int(t * feedback_hz), last_sample)
+    group_command.position = positions[i]
+    group_command.velocity = velocities[i]
     group.send_command(group_command)
 
 # Stop logging. `log_file` contains the contents of the file
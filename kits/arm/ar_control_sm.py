@@ -1,12 +1,19 @@
 from enum import Enum, auto
 import numpy as np
-from scipy.spatial.transform import Rotation as R
-from time import time, sleep
+from time import monotonic, sleep
 import os
 
 import hebi
 from hebi.util import create_mobile_io
 
+if __name__ == "__main__":
+    # Run as a script: add the root folder of the repository to the search
+    # path for modules. Importers (e.g. the tready kits) already have it.
+    import sys
+    root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    sys.path = [root_path] + sys.path
+from util.math_utils import quat2rot, rotate_x, rotate_z
+
 import typing
 if typing.TYPE_CHECKING:
     from typing import Optional
@@ -46,7 +53,7 @@ class ArmMobileIOControl:
         #self.arm_xyz_home = [0.34, 0.0, 0.23]
         # 6 DoF home
         self.arm_xyz_home = [0.5, 0.0, 0.0]
-        self.arm_rot_home: 'npt.NDArray[np.float64]' = (R.from_euler('z', np.pi / 2) * R.from_euler('x', np.pi)).as_matrix()
+        self.arm_rot_home: 'npt.NDArray[np.float64]' = rotate_z(np.pi / 2) @ rotate_x(np.pi)
 
         # 5 DoF seed
         #self.arm_seed_ik = np.array([0.25, -1.0, 0, -0.75, 0])
@@ -57,9 +64,27 @@ class ArmMobileIOControl:
             self.arm_xyz_home,
             self.arm_rot_home)
         
-        self.last_locked_xyz = self.arm_xyz_home.copy()
+        self.last_locked_xyz = np.array(self.arm_xyz_home, dtype=np.float64)
         self.last_locked_rot = self.arm_rot_home.copy()
         self.last_locked_seed = self.arm_home.copy()
+        # The locked xyz/rot are only needed once unlocked, so FK of the
+        # locked seed is deferred until then
+        self._locked_fk_pending = False
+        # IK is warm started from the previous solution while unlocked
+        self._ik_seed = self.arm_home.copy()
+        self._ik_step = np.empty_like(self._ik_seed)
+        # Norm of the joint step (rad) from the seed beyond which IK is
+        # assumed to have switched branch
+        self.ik_max_step = 0.5
+
+        # Scratch buffers for compute_arm_goal, reused every tick
+        self.xyz_scale = np.array([1.0, 1.0, 1.0])
+        self._phone_offset = np.empty(3, dtype=np.float64)
+        self._arm_xyz_target = np.empty(3, dtype=np.float64)
+        self._rot_tmp = np.empty((3, 3), dtype=np.float64)
+        self._arm_rot_target = np.empty((3, 3), dtype=np.float64)
+        # set_goal builds the trajectory immediately, so one Goal can be reused
+        self._arm_goal = hebi.arm.Goal(self.arm.size)
 
         self.locked = True
 
@@ -100,17 +125,7 @@ class ArmMobileIOControl:
         # If homing is complete, transition to teleop
         elif self.state is self.state.HOMING:
             if self.arm.at_goal:
-                self.phone_xyz_home = arm_input.phone_pos
-                self.phone_rot_home = arm_input.phone_rot
-                
-                self.last_locked_seed = np.array(self.arm.last_feedback.position)
-                xyz = np.zeros(3)
-                orientation = np.zeros((3,3))
-                self.arm.FK(self.arm.last_feedback.position, xyz_out=xyz, orientation_out=orientation)
-
-                self.last_locked_xyz = xyz
-                self.last_locked_rot = orientation
-
+                self.lock_to_feedback(arm_input)
                 self.transition_to(t_now, self.state.TELEOP)
 
         # Teleop mode
@@ -127,16 +142,7 @@ class ArmMobileIOControl:
                 if arm_goal is not None:
                     self.arm.set_goal(arm_goal)
             else:
-                self.phone_xyz_home = arm_input.phone_pos
-                self.phone_rot_home = arm_input.phone_rot
-
-                self.last_locked_seed = np.array(self.arm.last_feedback.position)
-                xyz = np.zeros(3)
-                orientation = np.zeros((3,3))
-                self.arm.FK(self.arm.last_feedback.position, xyz_out=xyz, orientation_out=orientation)
-
-                self.last_locked_xyz = xyz
-                self.last_locked_rot = orientation
+                self.lock_to_feedback(arm_input)
 
             gripper = self.arm.end_effector
             if gripper is not None:
@@ -166,22 +172,48 @@ class ArmMobileIOControl:
 
         self.state = state
 
+    def lock_to_feedback(self, arm_input: ArmMobileIOInputs):
+        """Re-anchors teleop at the arm's current pose and the phone's current pose."""
+        self.phone_xyz_home = arm_input.phone_pos
+        self.phone_rot_home = arm_input.phone_rot
+
+        # Written in place, the locked pose buffers are allocated once in __init__
+        np.copyto(self.last_locked_seed, self.arm.last_feedback.position)
+        np.copyto(self._ik_seed, self.last_locked_seed)
+        self._locked_fk_pending = True
+
     def compute_arm_goal(self, arm_input: ArmMobileIOInputs):
-        xyz_scale = np.array([1.0, 1.0, 1.0])
+        if self._locked_fk_pending:
+            self.arm.FK(self.last_locked_seed, xyz_out=self.last_locked_xyz, orientation_out=self.last_locked_rot)
+            self._locked_fk_pending = False
+
+        # arm_xyz_target = last_locked_xyz + xyz_scale * (rot_mat.T @ phone_offset)
+        np.subtract(arm_input.phone_pos, self.phone_xyz_home, out=self._phone_offset)
+        rot_mat_t = self.phone_rot_home.T
+        arm_xyz_target = self._arm_xyz_target
+        np.dot(rot_mat_t, self._phone_offset, out=arm_xyz_target)
+        arm_xyz_target *= self.xyz_scale
+        arm_xyz_target += self.last_locked_xyz
+
+        # arm_rot_target = rot_mat.T @ phone_rot @ last_locked_rot
+        np.matmul(rot_mat_t, arm_input.phone_rot, out=self._rot_tmp)
+        np.matmul(self._rot_tmp, self.last_locked_rot, out=self._arm_rot_target)
 
-        phone_offset = arm_input.phone_pos - self.phone_xyz_home
-        rot_mat = self.phone_rot_home
-        arm_xyz_target = self.last_locked_xyz + xyz_scale * (rot_mat.T @ phone_offset)
-        arm_rot_target = rot_mat.T @ arm_input.phone_rot @ self.last_locked_rot
-        
         joint_target = self.arm.ik_target_xyz_so3(
-            self.last_locked_seed,
+            self._ik_seed,
             arm_xyz_target,
-            arm_rot_target)
-
-        arm_goal = hebi.arm.Goal(self.arm.size)
-        arm_goal.add_waypoint(position=joint_target)
-        return arm_goal
+            self._arm_rot_target)
+        # A large jump from the seed means the solver likely switched IK branch,
+        # so solve once more from the measured joint position instead
+        np.subtract(joint_target, self._ik_seed, out=self._ik_step)
+        if np.linalg.norm(self._ik_step) > self.ik_max_step:
+            joint_target = self.arm.ik_target_xyz_so3(
+                self.arm.last_feedback.position,
+                arm_xyz_target,
+                self._arm_rot_target)
+        np.copyto(self._ik_seed, joint_target)
+
+        return self._arm_goal.clear().add_waypoint(position=joint_target)
     
     def home(self):
         g = hebi.arm.Goal(self.arm.size)
@@ -189,7 +221,7 @@ class ArmMobileIOControl:
         self.arm.set_goal(g)
         
     def stop(self):
-        self.transition_to(time(), self.state.EXIT)
+        self.transition_to(monotonic(), self.state.EXIT)
 
 
 def setup_mobile_io(m: 'MobileIO'):
@@ -211,10 +243,13 @@ def parse_mobile_feedback(m: 'MobileIO'):
     if m.get_button_state(1):
         return False, ArmMobileIOInputs(home=True)
     
-    try:
-        rotation = R.from_quat(m.orientation, scalar_first=True).as_matrix()
-    except ValueError as e:
-        print(f'Error getting orientation as matrix: {e}\n{m.orientation}')
+    # Mobile IO reports orientation as a [w, x, y, z] quaternion
+    orientation = m.orientation
+    quat_norm_sq = orientation @ orientation
+    if np.isfinite(quat_norm_sq) and quat_norm_sq > 0.0:
+        rotation = quat2rot(orientation / np.sqrt(quat_norm_sq))
+    else:
+        print(f'Error getting orientation as matrix: invalid quaternion\n{orientation}')
         rotation = np.eye(3)
 
     arm_input = ArmMobileIOInputs(
@@ -265,7 +300,7 @@ if __name__ == "__main__":
     #######################
 
     while arm_control.running:
-        t = time()
+        t = monotonic()
         try:
             quit, arm_input = parse_mobile_feedback(m)
             if quit:
@@ -79,6 +79,8 @@ arm.group.feedback_frequency = 200.0
 
 enable_logging = False
 goal = hebi.arm.Goal(arm.size)
+# End effector pose, rewritten in place by get_end_effector
+ee_pose_curr = np.eye(4)
 
 # Start background logging
 if enable_logging:
@@ -136,7 +138,6 @@ while not mobile_io.get_button_state(quit_btn):
     else:
 
         # Use forward kinematics to calculate pose of end-effector
-        ee_pose_curr = np.eye(4)
         arm.robot_model.get_end_effector(arm.last_feedback.position, ee_pose_curr)
 
         # Assign mode based on current position
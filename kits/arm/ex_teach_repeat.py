@@ -20,6 +20,7 @@ mobile_io = create_mobile_io_from_config(example_config, lookup)
 abort_flag = False
 run_mode = "training"
 goal = hebi.arm.Goal(arm.size)
+zero_velocity = [0] * arm.size
 base_travel_time = example_config.user_data['base_travel_time']
 min_travel_time = example_config.user_data['min_travel_time']
 
@@ -66,7 +67,7 @@ while not abort_flag:
         if mobile_io.get_button_diff(1) == 1:  # "ToOn"
             print("Stop waypoint added")
             goal.add_waypoint(t= base_travel_time + slider3 * (base_travel_time - min_travel_time), 
-                              position=arm.last_feedback.position, velocity=[0] * arm.size)
+                              position=arm.last_feedback.position, velocity=zero_velocity)
             
         # B2 - add waypoint (flow)
         if mobile_io.get_button_diff(2) == 1:  # "ToOn"
@@ -44,6 +44,7 @@ m.update()
 abort_flag = False
 run_mode = "training"
 goal = hebi.arm.Goal(arm.size)
+zero_velocity = [0] * arm.size
 
 # Print Instructions
 instructions = """B1 - Add waypoint (stop)
@@ -88,7 +89,7 @@ while not abort_flag:
         # B1 - add waypoint (stop)
         if m.get_button_diff(1) == 1:  # "ToOn"
             print("Stop waypoint added")
-            goal.add_waypoint(t=slider3 + 3.0, position=arm.last_feedback.position, velocity=[0] * arm.size)
+            goal.add_waypoint(t=slider3 + 3.0, position=arm.last_feedback.position, velocity=zero_velocity)
 
         # B2 - add waypoint (flow)
         if m.get_button_diff(2) == 1:  # "ToOn"
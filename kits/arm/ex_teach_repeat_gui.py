@@ -9,16 +9,53 @@ Works with latest Python API
 import hebi
 import numpy as np
 from tkinter import * # Tkinter is the built in PYTHON Animation Program
+from collections import deque
+from enum import Enum, auto
 from time import sleep
 from hebi import arm as arm_api
 from hebi.util import create_mobile_io
 
 
+class RunMode(Enum):
+    TRAINING = auto()
+    PLAYBACK = auto()
+
+
+class WaypointPool:
+    """Preallocated storage for the end effector position, travel time and
+    gripper toggle of each recorded waypoint."""
+
+    __slots__ = ('xyz', 'time', 'gripper', 'count')
+
+    def __init__(self, capacity: int):
+        self.xyz = np.empty((capacity, 3), dtype=np.float64)
+        self.time = np.empty(capacity, dtype=np.float64)
+        self.gripper = np.empty(capacity, dtype=np.int8)
+        self.count = 0
+
+    def add(self, duration: float, gripper_toggled: int):
+        """Records a waypoint's timing and gripper info. Returns the row of
+        `xyz` that the waypoint's end effector position is written into."""
+        n = self.count
+        if n == len(self.time):
+            # Double the buffers once full instead of reallocating on every add
+            self.xyz = np.resize(self.xyz, (2 * n, 3))
+            self.time = np.resize(self.time, 2 * n)
+            self.gripper = np.resize(self.gripper, 2 * n)
+
+        self.time[n] = duration
+        self.gripper[n] = gripper_toggled
+        self.count = n + 1
+        return self.xyz[n]
+
+    def clear(self):
+        self.count = 0
+
+
 class DataStruct:
   def __init__(self):
     self.width: int
     self.height: int
-    self.timerDelay: int
     self.margin: float
     self.buttonList: list[str]
 
@@ -31,12 +68,14 @@ def keyPressed(event, data: DataStruct):
 
 BUTTON_WIDTH = 150
 BUTTON_HEIGHT = 75
+WAYPOINT_CAPACITY = 16
+# Redraw the canvas every this many control ticks (or right after a click)
+REDRAW_TICKS = 20
 
 
 #----- The Start of the Graphical Interface ------#
 def init(data: DataStruct):
     data.margin = 20 # Spacing for every new waypoint
-    data.timerDelay = 5
   
     # Create a list of Buttons to be drawn on the canvas
     data.buttonList = ["B1 \n Add Stop Waypoint ",
@@ -47,7 +86,15 @@ def init(data: DataStruct):
               "B8 \n Quit"]
     data.buttonColors =["yellow"] * len(data.buttonList)
 
-    data.buttonPress = np.zeros((len(data.buttonList), 1))
+    # Button clicks queued by the mouse handler, consumed once per tick
+    data.buttonQueue = deque()
+    data.ticksSinceRedraw = 0
+    data.needsRedraw = True
+
+    # Canvas items are created once and then updated in place
+    data.buttonRects = []
+    data.drawnWaypoints = 0
+    data.waypointRowsStale = False
   
     # Sizing values for the buttons
     data.buttonwidth = 150
@@ -55,16 +102,13 @@ def init(data: DataStruct):
 
     data.buttonPos = createButtonPos(data)
 
-    # Initializing list to keep track of waypoints
-    data.run_mode = "training"
-    data.goal = np.empty((0,3), dtype=np.float64)
-    data.time = np.array([])
-    data.gripper = np.array([])
+    # Initializing the pool to keep track of waypoints
+    data.run_mode = RunMode.TRAINING
+    data.waypoints = WaypointPool(WAYPOINT_CAPACITY)
 
 
 def run(width, height):
     def redrawAllWrapper(canvas: Canvas, data: DataStruct):
-        canvas.delete(ALL)
         redrawAll(canvas, data)
         canvas.update()
 
@@ -80,16 +124,23 @@ def run(width, height):
         abort_flag = timerFired(data)
         if abort_flag == True:
             print("Timer Fire Wrapper Abort")
-        redrawAllWrapper(canvas, data)
-        # pause, then call timerFired again
-        canvas.after(data.timerDelay, timerFiredWrapper, canvas, data)
+        # Redrawing every widget each tick would tie the control rate to Tk,
+        # so only redraw at a reduced rate or when a click changed something
+        data.ticksSinceRedraw += 1
+        if data.needsRedraw or data.ticksSinceRedraw >= REDRAW_TICKS:
+            redrawAllWrapper(canvas, data)
+            data.ticksSinceRedraw = 0
+            data.needsRedraw = False
+        # arm.update() blocks until the next feedback packet arrives, so the
+        # feedback rate paces this loop. Run again as soon as pending GUI
+        # events are handled instead of sleeping on top of that wait.
+        canvas.after_idle(timerFiredWrapper, canvas, data)
         # Set up data and call init
         return abort_flag
 
     data = DataStruct()
     data.width = width
     data.height = height
-    data.timerDelay = 5 # milliseconds
     init(data)
     # create the root and the canvas
     root = Tk()
@@ -165,8 +216,9 @@ if __name__ == "__main__":
     # Demo Variables
     abort_flag = False
     pending_goal = False
-    run_mode = "training"
+    run_mode = RunMode.TRAINING
     goal = arm_api.Goal(arm.size)
+    zero_velocity = [0] * arm.size
     
     # Printing Instructions
     instructions = """B1 - Add waypoint (stop)
@@ -208,117 +260,129 @@ if __name__ == "__main__":
         for row, pos in enumerate(data.buttonPos):
             (x1,y1,x2,y2) = pos 
             if (x1 < mx < x2) and (y1 < my < y2):
-                data.buttonPress[row] = 1
+                data.buttonQueue.append(row)
       
     
     def timerFired(data):
         #updatewaypoints(data)
         arm.update()
+
+        # Drain the clicks received since the last tick
+        pressed = set()
+        while data.buttonQueue:
+            pressed.add(data.buttonQueue.popleft())
+        if pressed:
+            data.needsRedraw = True
     
         # Set all the button colors to yellow
         data.buttonColors =["yellow"]*len(data.buttonList)
     
         # Shutting Down the Arm
-        if data.buttonPress[5] == 1: # "ToOn"
+        if 5 in pressed: # "ToOn"
             print("Shutting Down the Program")
             data.buttonColors[5] = "blue"
             abort_flag = True
             quit()
     
         # Keep Button 5 as blue when the code is in playback mode
-        if data.run_mode == "playback":
+        if data.run_mode is RunMode.PLAYBACK:
             data.buttonColors[3] = "blue"
     
-        if data.run_mode == "training":
+        if data.run_mode is RunMode.TRAINING:
             # B1 add waypoint (stop)
-            if data.buttonPress[0] == 1: # "ToOn"
+            if 0 in pressed: # "ToOn"
                 print("Stop waypoint added")
-                goal.add_waypoint(t=3.0, position=arm.last_feedback.position, aux=gripper.state, velocity=[0]*arm.size)
-                data.time = np.append(data.time, 3.0)
-                data.gripper = np.append(data.gripper, 0)
-                data.goal=np.append(data.goal, [arm.FK(arm.last_feedback.position)], axis = 0)
+                goal.add_waypoint(t=3.0, position=arm.last_feedback.position, aux=gripper.state, velocity=zero_velocity)
+                arm.FK(arm.last_feedback.position, xyz_out=data.waypoints.add(3.0, 0))
                 data.buttonColors[0] = "blue"
     
             # B2 add waypoint (stop) and toggle the gripper
-            if data.buttonPress[1] == 1: # "ToOn"
+            if 1 in pressed: # "ToOn"
                 # Add 2 waypoints to allow the gripper to open or close
                 print("Stop waypoint added and gripper toggled")
                 position = arm.last_feedback.position
-                goal.add_waypoint(t= 3.0, position=position, aux=gripper.state, velocity=[0]*arm.size)
+                goal.add_waypoint(t= 3.0, position=position, aux=gripper.state, velocity=zero_velocity)
                 gripper.toggle()
-                goal.add_waypoint(t=2.0, position=position, aux=gripper.state, velocity=[0]*arm.size)
+                goal.add_waypoint(t=2.0, position=position, aux=gripper.state, velocity=zero_velocity)
     
-                data.time = np.append(data.time, 5.0)
-                data.gripper = np.append(data.gripper, 1)
-                data.goal=np.append(data.goal, [arm.FK(arm.last_feedback.position)], axis = 0)
+                arm.FK(position, xyz_out=data.waypoints.add(5.0, 1))
                 data.buttonColors[1] = "blue"
     
             # B3 add waypoint (flow)
-            if data.buttonPress[2] == 1: # "ToOn"
+            if 2 in pressed: # "ToOn"
                 print("Flow waypoint added")
                 goal.add_waypoint(t= 3.0, position=arm.last_feedback.position, aux=gripper.state)
-                data.time = np.append(data.time, 3.0)
-                data.gripper = np.append(data.gripper, 0)
-                data.goal=np.append(data.goal, [arm.FK(arm.last_feedback.position)], axis = 0)
+                arm.FK(arm.last_feedback.position, xyz_out=data.waypoints.add(3.0, 0))
                 data.buttonColors[2] = "blue"
     
             # B5 toggle training/playback
-            if data.buttonPress[3] == 1: # "ToOn"
+            if 3 in pressed: # "ToOn"
                 # Check for more than 2 waypoints
                 if goal.waypoint_count > 1:
                     print("Transitioning to playback mode")
-                    data.run_mode = "playback"
+                    data.run_mode = RunMode.PLAYBACK
                     arm.set_goal(goal)
                 else:
                     print("At least two waypoints are needed")
                 data.buttonColors[3] = "blue"
     
             # B6 clear waypoints
-            if data.buttonPress[4] == 1: # "ToOn"
+            if 4 in pressed: # "ToOn"
                 print("Waypoints cleared")
                 goal.clear()
-                data.goal = np.zeros((1,3), dtype=np.float64)
-                data.time = np.array([])
-                data.gripper = np.array([])
+                data.waypoints.clear()
+                data.waypointRowsStale = True
                 data.buttonColors[4] = "blue"
     
-        elif data.run_mode == "playback":    
+        elif data.run_mode is RunMode.PLAYBACK:
             # B5 toggle training/playback
-            if data.buttonPress[3] == 1: # "ToOn"
+            if 3 in pressed: # "ToOn"
                 print("Transitioning to training mode")
-                data.run_mode = "training"
+                data.run_mode = RunMode.TRAINING
                 arm.cancel_goal()
     
             # replay through the path again once the goal has been reached
             if arm.at_goal:
                 arm.set_goal(goal)
-        data.buttonPress = np.zeros((data.buttonRows, 1)) #Reset the buttonClick
         arm.send()
     
     def drawText(canvas: Canvas, data: DataStruct):
-        # Draws First Row Text
-        canvas.create_text(5, data.margin, text="Waypoints",anchor= SW)
-        canvas.create_text(150, data.margin, text="Joints",anchor= SW)
-        canvas.create_text(300, data.margin, text="Time",anchor= SW)
-        canvas.create_text(400, data.margin, text="Gripper",anchor= SW)
-    
-        # Displaying all the buttons on the screen
-        for row, pos in enumerate(data.buttonPos):
-            (x1,y1,x2,y2) = pos 
-            canvas.create_rectangle(x1,y1,x2,y2, fill= data.buttonColors[row])
-            canvas.create_text(x1+(x2 - x1)/2, y1+(y2 - y1)/2, text= data.buttonList[row], justify = CENTER)
+        if not data.buttonRects:
+            # Draws First Row Text
+            canvas.create_text(5, data.margin, text="Waypoints",anchor= SW)
+            canvas.create_text(150, data.margin, text="Joints",anchor= SW)
+            canvas.create_text(300, data.margin, text="Time",anchor= SW)
+            canvas.create_text(400, data.margin, text="Gripper",anchor= SW)
+
+            # Displaying all the buttons on the screen
+            for row, pos in enumerate(data.buttonPos):
+                (x1,y1,x2,y2) = pos
+                data.buttonRects.append(canvas.create_rectangle(x1,y1,x2,y2, fill= data.buttonColors[row]))
+                canvas.create_text(x1+(x2 - x1)/2, y1+(y2 - y1)/2, text= data.buttonList[row], justify = CENTER)
+
+        # Only the button colors change between redraws
+        for rect, color in zip(data.buttonRects, data.buttonColors):
+            canvas.itemconfigure(rect, fill=color)
 
         # Adding Waypoints information
-        # Draw added goal positions
-        numWayPoints = len(data.time)
-        for row in range(numWayPoints):
-            canvas.create_text(5, data.margin * (row+2), text="%d" % int(row + 1),anchor= SW)
-            goalList = data.goal[row]
-            goalList = np.around(goalList, 2)
+        # Remove the drawn rows if the waypoints were cleared
+        waypoints = data.waypoints
+        if data.waypointRowsStale or waypoints.count < data.drawnWaypoints:
+            canvas.delete("waypoint")
+            data.drawnWaypoints = 0
+            data.waypointRowsStale = False
+
+        # Draw only the goal positions added since the last redraw, rounding
+        # all of the new rows at once
+        first = data.drawnWaypoints
+        goals = np.around(waypoints.xyz[first:waypoints.count], 2)
+        for row, goalList in enumerate(goals, first):
+            canvas.create_text(5, data.margin * (row+2), text="%d" % int(row + 1),anchor= SW, tags="waypoint")
             goalStr = str(goalList)
-            canvas.create_text(150, data.margin * (row+2), text= goalStr,anchor= SW)
-            canvas.create_text(300, data.margin * (row+2), text="%0.1f" % float(data.time[row]),anchor= SW)
-            canvas.create_text(400, data.margin * (row+2), text="%d" % data.gripper[row] ,anchor= SW)
+            canvas.create_text(150, data.margin * (row+2), text= goalStr,anchor= SW, tags="waypoint")
+            canvas.create_text(300, data.margin * (row+2), text="%0.1f" % float(waypoints.time[row]),anchor= SW, tags="waypoint")
+            canvas.create_text(400, data.margin * (row+2), text="%d" % waypoints.gripper[row] ,anchor= SW, tags="waypoint")
+        data.drawnWaypoints = waypoints.count
     
     def redrawAll(canvas, data):
         drawText(canvas, data)
@@ -23,6 +23,7 @@ abort_flag = False
 pending_goal = False
 run_mode = "training"
 goal = hebi.arm.Goal(arm.size)
+zero_velocity = [0] * arm.size
 base_travel_time = example_config.user_data['base_travel_time']
 min_travel_time = example_config.user_data['min_travel_time']
 
@@ -71,7 +72,7 @@ while not abort_flag:
         if mobile_io.get_button_diff(1) == 1:  # "ToOn"
             print("Stop waypoint added")
             goal.add_waypoint(t= base_travel_time + slider3 * (base_travel_time - min_travel_time), 
-                              position=arm.last_feedback.position, velocity=[0] * arm.size)
+                              position=arm.last_feedback.position, velocity=zero_velocity)
 
         # B2 add waypoint (stop) and toggle the gripper
         if mobile_io.get_button_diff(2) == 1:  # "ToOn"
@@ -79,14 +80,14 @@ while not abort_flag:
             print("Stop waypoint added and gripper toggled")
             position = arm.last_feedback.position
             goal.add_waypoint(t= base_travel_time + slider3 * (base_travel_time - min_travel_time), 
-                              position=arm.last_feedback.position, velocity=[0] * arm.size)
+                              position=arm.last_feedback.position, velocity=zero_velocity)
             gripper.toggle()
 
         # B3 add waypoint (flow)
         if mobile_io.get_button_diff(3) == 1:  # "ToOn"
             print("Flow waypoint added")
             goal.add_waypoint(t= base_travel_time + slider3 * (base_travel_time - min_travel_time), 
-                              position=arm.last_feedback.position, velocity=[0] * arm.size)
+                              position=arm.last_feedback.position, velocity=zero_velocity)
 
         # B5 toggle training/playback
         if mobile_io.get_button_diff(5) == 1:  # "ToOn"
@@ -2,7 +2,7 @@ import os
 from enum import Enum, auto
 import numpy as np
 from scipy.spatial.transform import Rotation as R
-from time import time, sleep
+from time import monotonic, sleep
 
 import hebi
 from hebi.util import create_mobile_io
@@ -45,9 +45,16 @@ class ArmJoystickControl:
             self.joint_limits = np.empty((arm.size, 2))
             self.joint_limits[:, 0] = -np.inf
             self.joint_limits[:, 1] = np.inf
+        # Lower and upper limits as contiguous vectors, checked against every IK solution
+        self._joint_min = np.ascontiguousarray(self.joint_limits[:arm.size, 0])
+        self._joint_max = np.ascontiguousarray(self.joint_limits[:arm.size, 1])
 
         self.xyz_curr = np.empty(3)
         self.rot_curr = np.empty((3, 3))
+        # set_goal builds the trajectory immediately, so one Goal can be reused
+        self.arm_goal = hebi.arm.Goal(arm.size)
+        # Joint target of the last teleop goal sent, used to skip resending it
+        self.last_goal_target = np.full(arm.size, np.nan)
         self.joint_target = arm.last_feedback.position_command
 
     @property
@@ -86,7 +93,8 @@ class ArmJoystickControl:
                 return
 
             arm_goal = self.compute_arm_goal(demo_input)
-            self.arm.set_goal(arm_goal)
+            if arm_goal is not None:
+                self.arm.set_goal(arm_goal)
 
             gripper_closed = self.arm.end_effector.state == 1.0
             if demo_input.gripper_closed and not gripper_closed:
@@ -107,6 +115,7 @@ class ArmJoystickControl:
             g = hebi.arm.Goal(self.arm.size)
             g.add_waypoint(t=self.homing_time, position=self.arm_home)
             self.arm.set_goal(g)
+            self.last_goal_target.fill(np.nan)
 
         elif state is self.state.TELEOP:
             print("TRANSITIONING TO TELEOP")
@@ -120,7 +129,6 @@ class ArmJoystickControl:
         self.state = state
 
     def compute_arm_goal(self, arm_inputs: ArmJoystickInputs):
-        arm_goal = hebi.arm.Goal(self.arm.size)
         pos_curr = self.arm.last_feedback.position_command
 
         if np.any(np.isnan(pos_curr)):
@@ -153,16 +161,17 @@ class ArmJoystickControl:
             arm_xyz_target,
             arm_rot_target.as_matrix())
 
-        out_of_bounds = False
-        for idx, joint in enumerate(joint_target):
-            if joint < self.joint_limits[idx, 0] or joint > self.joint_limits[idx, 1]:
-                out_of_bounds = True
+        out_of_bounds = np.any((joint_target < self._joint_min) | (joint_target > self._joint_max))
 
         if not out_of_bounds:
             self.joint_target = joint_target
 
-        arm_goal.add_waypoint(position=self.joint_target)
-        return arm_goal
+        # While holding still the same target comes back every tick, don't resend it
+        if np.all(np.abs(self.joint_target - self.last_goal_target) <= 1e-4):
+            return None
+        np.copyto(self.last_goal_target, self.joint_target)
+
+        return self.arm_goal.clear().add_waypoint(position=self.joint_target)
 
 
 def setup_mobile_io(m: 'MobileIO'):
@@ -285,7 +294,7 @@ if __name__ == "__main__":
     #######################
 
     while arm_control.running:
-        t = time()
+        t = monotonic()
         try:
             arm_inputs = parse_mobile_feedback(m)
             arm_control.update(t, arm_inputs)
@@ -1,18 +1,36 @@
+import numpy as np
 from matplotlib import pyplot as plt
 
 def draw_plots(hebi_log):
-    
+
     # Plot tracking / error from the joints in the arm.
-    time = []
-    position = []
-    velocity = []
-    effort = []
+    # Log entries are copied into preallocated (entries x modules) arrays,
+    # doubled whenever they fill up
+    num_modules = hebi_log.number_of_modules
+    capacity = 1024
+    time = np.empty((capacity, num_modules))
+    position = np.empty((capacity, num_modules))
+    velocity = np.empty((capacity, num_modules))
+    effort = np.empty((capacity, num_modules))
+    count = 0
     # iterate through log
     for entry in hebi_log.feedback_iterate:
-        time.append(entry.transmit_time)
-        position.append(entry.position)
-        velocity.append(entry.velocity)
-        effort.append(entry.effort)
+        if count == capacity:
+            capacity *= 2
+            time = np.resize(time, (capacity, num_modules))
+            position = np.resize(position, (capacity, num_modules))
+            velocity = np.resize(velocity, (capacity, num_modules))
+            effort = np.resize(effort, (capacity, num_modules))
+        time[count] = entry.transmit_time
+        position[count] = entry.position
+        velocity[count] = entry.velocity
+        effort[count] = entry.effort
+        count += 1
+
+    time = time[:count]
+    position = position[:count]
+    velocity = velocity[:count]
+    effort = effort[:count]
 
     # Offline Visualization
     # Plot the logged position feedback
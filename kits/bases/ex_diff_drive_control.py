@@ -2,8 +2,9 @@
 
 import hebi
 import numpy as np
-from time import sleep, time
-import hebi
+from collections import deque
+from statistics import quantiles
+from time import monotonic, perf_counter, sleep
 from hebi.util import create_mobile_io
 
 
@@ -26,6 +27,11 @@ def load_gains(group, gains_file):
 class DiffDrive:
     WHEEL_RADIUS = 0.10  # m
     BASE_RADIUS = 0.43  # m (half of distance between diff drive wheel centers)
+    # Wheel velocity (rad/s) per unit of base yaw rate (rad/s) / forward speed (m/s)
+    TURN_TO_WHEEL_VEL = BASE_RADIUS / WHEEL_RADIUS
+    DRIVE_TO_WHEEL_VEL = 1.0 / WHEEL_RADIUS
+    INPUT_DEADBAND = 1e-3  # dx (m/s) / dtheta (rad/s) treated as no input
+    LATENCY_REPORT_PERIOD = 500  # commands sent between latency printouts
 
     def __init__(self, group):
         self.group = group
@@ -34,73 +40,112 @@ class DiffDrive:
         self.trajectory = None
         self.trajectory_start_time = 0
         self.start_wheel_pos = np.array([0, 0])
+        # Position command buffer, the command setter copies it out each tick
+        self.wheel_pos_cmd = np.empty(group.size)
         self.color = hebi.Color(0, 0, 0)
 
+        # Waypoint buffers reused for every trajectory rebuild
+        # (create_trajectory copies its inputs)
+        self.traj_times = np.array([0, 0.15, 0.9, 1.2])
+        self.traj_velocities = np.zeros((2, 4))
+        # start position 0, unconstrained waypoints afterwards
+        self.traj_positions = np.full((2, 4), np.nan)
+        self.traj_positions[:, 0] = 0
+        self.traj_accelerations = np.zeros((2, 4))
+
+        # (feedback wait, command send) durations in seconds for recent ticks
+        self.latencies = deque(maxlen=1000)
+        self.latency_count = 0
+
     def update(self, t_now):
+        t0 = perf_counter()
         if not self.group.get_next_feedback(reuse_fbk=self.base_feedback):
             return False
+        t1 = perf_counter()
 
         if self.trajectory:
             t = min(t_now - self.trajectory_start_time, self.trajectory.duration)
             p, v, _ = self.trajectory.get_state(t)
-            self.base_command.position = self.start_wheel_pos + p
+            np.add(self.start_wheel_pos, p, out=self.wheel_pos_cmd)
+            self.base_command.position = self.wheel_pos_cmd
             self.base_command.velocity = v
 
             self.base_command.led.color = self.color
-            #print(f"P: {p}")
-            print(f"V: {v}")
             self.group.send_command(self.base_command)
 
+            self.latencies.append((t1 - t0, perf_counter() - t1))
+            self.latency_count += 1
+            if self.latency_count % self.LATENCY_REPORT_PERIOD == 0:
+                self.print_latency_stats()
+
+    def print_latency_stats(self):
+        for name, samples in zip(('feedback', 'send'), zip(*self.latencies)):
+            cuts = quantiles(samples, n=100)
+            print(f'{name} latency (ms): p50 {cuts[49] * 1e3:.2f}, p95 {cuts[94] * 1e3:.2f}, p99 {cuts[98] * 1e3:.2f}')
+
+    def stop(self):
+        self.trajectory = None
+        self.base_command.position = np.full(self.group.size, np.nan)
+        self.base_command.velocity = np.zeros(self.group.size)
+
+        # Send multiple times, so a dropped packet can't leave the wheels moving
+        for i in range(3):
+            self.group.send_command(self.base_command)
+            sleep(0.01)
+
     def build_smooth_velocity_trajectory(self, dx, dtheta, t_now):
-        times = np.array([0, 0.15, 0.9, 1.2])
+        # With no input and the last trajectory finished (they all end at rest),
+        # a rebuilt trajectory would only hold the same position
+        if (self.trajectory is not None
+                and abs(dx) < self.INPUT_DEADBAND
+                and abs(dtheta) < self.INPUT_DEADBAND
+                and t_now - self.trajectory_start_time >= self.trajectory.duration):
+            return
+
+        # Last column stays zero: the trajectory always ends at rest
+        velocities = self.traj_velocities
 
-        cmd_vels = np.zeros(2)
         if self.trajectory is None:
             self.start_wheel_pos = self.base_feedback.position
+            velocities[:, 0] = 0
         else:
             t = min(t_now - self.trajectory_start_time, self.trajectory.duration)
             cmd_pos, cmd_vels, _ = self.trajectory.get_state(t)
             self.start_wheel_pos += cmd_pos
+            velocities[:, 0] = cmd_vels
 
-        target_vel_wheels = np.zeros(2)
-        target_vel_wheels[0] = -1 * dtheta * (self.BASE_RADIUS / self.WHEEL_RADIUS)
-        target_vel_wheels[1] = -1 * dtheta * (self.BASE_RADIUS / self.WHEEL_RADIUS)
+        # Both wheels share the turning term; driving forward spins them in
+        # opposite directions since they are mounted mirrored
+        turn_vel = -dtheta * self.TURN_TO_WHEEL_VEL
+        drive_vel = dx * self.DRIVE_TO_WHEEL_VEL
+        velocities[0, 1] = turn_vel + drive_vel
+        velocities[1, 1] = turn_vel - drive_vel
 
-        target_vel_wheels[0] += dx / self.WHEEL_RADIUS
-        target_vel_wheels[1] -= dx / self.WHEEL_RADIUS
+        velocities[:, 2] = velocities[:, 1]
 
-        velocities = np.empty((2, 4))
-        velocities[:, 0] = cmd_vels
-        velocities[:, 1] = target_vel_wheels
-        velocities[:, 2] = target_vel_wheels
-        velocities[:, 3] = [0, 0]
-
-        self.build_velocity_trajectory(t_now, times, velocities)
+        self.build_velocity_trajectory(t_now, self.traj_times, velocities)
 
     def build_velocity_trajectory(self, t_now, times, velocities):
-
-        # start position 0, unconstrained waypoints afterwards
-        p = np.empty((2, 4))
-        p.fill(np.nan)
-        p[:, 0] = 0
-
-        a = np.zeros((2, 4))
+        p = self.traj_positions
+        a = self.traj_accelerations
 
         self.trajectory = hebi.trajectory.create_trajectory(times, p, velocities, a)
         self.trajectory_start_time = t_now
 
 
-if __name__ == "__main__":
-
+def main():
     lookup = hebi.Lookup()
-    sleep(2)
 
     # Base setup
     base_family = "HEBI"
     module_names = ['W1_left', 'W2_right']
 
-    # Create group
+    # Create group, retrying until the modules have been discovered
+    lookup_deadline = monotonic() + 10.0
     group = lookup.get_group_from_names([base_family], module_names)
+    while group is None and monotonic() < lookup_deadline:
+        sleep(0.25)
+        group = lookup.get_group_from_names([base_family], module_names)
     if group is None:
         raise RuntimeError(f"Could not find Diff Drive modules: {module_names} in family '{base_family}'")
     load_gains(group, "gains/diff_drive.xml")
@@ -111,7 +156,11 @@ if __name__ == "__main__":
     phone_name = "mobileIO"
 
     print('Waiting for Mobile IO device to come online...')
+    lookup_deadline = monotonic() + 10.0
     m = create_mobile_io(lookup, base_family, phone_name)
+    while m is None and monotonic() < lookup_deadline:
+        sleep(0.25)
+        m = create_mobile_io(lookup, base_family, phone_name)
     if m is None:
         raise RuntimeError("Could not find Mobile IO device")
     m.set_led_color("blue")
@@ -131,10 +180,15 @@ if __name__ == "__main__":
     #######################
 
     while not abort_flag:
-        base.update(time())
-
-        if not m.update():
-            print("Failed to get feedback from MobileIO")
+        # The loop is paced by the blocking wheel feedback; trajectories are
+        # timed on the monotonic clock so wall-clock adjustments can't jump them
+        t = monotonic()
+        base.update(t)
+
+        # Poll the phone without blocking. Waiting on its feedback here would
+        # stall the wheel commands whenever a Mobile IO packet is late; without
+        # new input the current trajectory simply keeps playing out.
+        if not m.update(0.0):
             continue
 
         # B8 - Quit
@@ -142,10 +196,15 @@ if __name__ == "__main__":
             # Reset text & color, and quit
             m.clear_text()
             m.set_led_color("transparent")
+            base.stop()
             abort_flag = True
             break
 
         dtheta = pow(m.get_axis_state(1), 3) * 2.0
         dx = pow(m.get_axis_state(8), 3)
 
-        base.build_smooth_velocity_trajectory(dx, dtheta, time())
+        base.build_smooth_velocity_trajectory(dx, dtheta, t)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from numpy import float32, float64, nan, sign
 from numpy.linalg import det, norm, svd
 from time import sleep, time
 from util.math_utils import quat2rot
+from util.realtime_utils import lock_memory, set_thread_realtime
 
 import hebi
 from .joystick_interface import register_hexapod_event_handlers
@@ -103,7 +104,7 @@ class Hexapod:
         '_group', '_group_command', '_group_feedback', '_group_info',
         '_auxilary_group_command',
         # Lifecycle state
-        '_input_lock', '_state_lock', '_proc_thread', '_quit_flag', '_started',
+        '_input_lock', '_state_lock', '_proc_thread', '_quit_event', '_started',
         '_on_stop_callbacks', '_on_startup_callbacks', '_num_spins',
         # Fields whjch pertain to controlling demo
         '_mobile_io', '_rotation_velocity', '_translation_velocity',
@@ -122,7 +123,6 @@ class Hexapod:
         self._config = config
         self._params = params
         self._started = False
-        self._quit_flag = False
         self._num_spins = 0
         self._mode = 'step'  # TODO: Should there be a 'startup' mode as well?
         # Identifies which set of 3 legs to enable walking
@@ -137,10 +137,12 @@ class Hexapod:
         self._on_stop_callbacks = list()
         self._on_startup_callbacks = list()
 
-        from threading import Lock
+        from threading import Event, Lock
         # Used to synchronize input commands
         self._input_lock = Lock()
         self._state_lock = Lock()
+        # Set by `request_stop()`. Checked every spin without taking `_state_lock`
+        self._quit_event = Event()
 
     def _wait_for_feedback(self):
         self._group.get_next_feedback(reuse_fbk=self._group_feedback)
@@ -163,10 +165,7 @@ class Hexapod:
         self._gravity[:] = avg_gravity
 
     def _should_continue(self):
-        """
-        Contract: This method assumes the caller has acquired `_state_lock`
-        """
-        if not is_main_thread_active() or self._quit_flag:
+        if not is_main_thread_active() or self._quit_event.is_set():
             return False
         return True
 
@@ -327,21 +326,15 @@ class Hexapod:
                 self._last_time = self._start_time
                 first_run = False
 
-            self._state_lock.acquire()
             while self._should_continue():
-                self._state_lock.release()
                 self._spin_once()
                 self._num_spins += 1
-                self._state_lock.acquire()
 
-            if self._quit_flag:
+            if self._quit_event.is_set():
                 self._stop_time = time()
-                self._state_lock.release()
                 self._stop()
                 # Break out if quit was requested
                 return
-            else:
-                self._state_lock.release()
 
     def add_on_stop_callback(self, callback):
         self._on_stop_callbacks.append(callback)
@@ -355,10 +348,8 @@ class Hexapod:
 
         :raises RuntimeError: if `start()` has not been called
         """
-        self._state_lock.acquire()
         # TODO: self._ensure_started()
-        self._quit_flag = True
-        self._state_lock.release()
+        self._quit_event.set()
 
     def start(self):
         with self._state_lock:
@@ -427,6 +418,9 @@ class Hexapod:
                     # Allow the calling thread to continue
                     start_condition.notify_all()
 
+                # Best effort, only applies when running with enough privileges
+                lock_memory()
+                set_thread_realtime()
                 self._start()
 
             self._proc_thread = Thread(target=start_routine,
@@ -4,7 +4,7 @@ from .leg import Leg
 from hebi.robot_model import endeffector_position_objective
 from hebi.trajectory import create_trajectory
 from numpy import float32, float64
-from numpy.linalg import norm, solve, LinAlgError
+from numpy.linalg import solve, LinAlgError
 
 # TODO: Parameterize
 period = 0.7
@@ -16,6 +16,7 @@ max_waypoint_count = 3
 #       from timepoints being too close to one another
 ignore_waypoint_threshold = 0.015
 replan_stance_vel_threshold = 0.05
+replan_stance_vel_threshold_sq = replan_stance_vel_threshold * replan_stance_vel_threshold
 
 reference_time = np.array(phase, dtype=float64) * period
 
@@ -158,7 +159,9 @@ class Step:
 
         # Check if there has been any change in the stance velocity. If so, re-plan
         current_stance_vel = leg.stance_vel_xyz.copy()
-        if norm(current_stance_vel - self._lift_off_vel) > replan_stance_vel_threshold:
+        vel_change = current_stance_vel - self._lift_off_vel
+        # Compare squared magnitudes to skip the sqrt
+        if vel_change.dot(vel_change) > replan_stance_vel_threshold_sq:
             # Replan
             self._replan_step(current_stance_vel)
 
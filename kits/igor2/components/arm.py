@@ -58,6 +58,7 @@ class Arm(PeripheralBody):
         self._user_commanded_wrist_velocity = 0.0
 
         self._grav_comp_torque = np.zeros(len(home_angles), np.float64)
+        self._gravity = np.zeros(3, np.float64)
 
         # Additionally, calculate determinant of jacobians
         self._current_det_actual = 0.0
@@ -172,7 +173,8 @@ class Arm(PeripheralBody):
         self._vel_error *= Arm.damper_gains
         np.add(self._pos_error, self._vel_error, out=self._impedance_err)
         np.dot(self._current_j_actual.T, np.asarray(self._impedance_err), out=self._impedance_torque)
-        np.copyto(self._grav_comp_torque.ravel(), self._kin.get_grav_comp_efforts(self._fbk.position, -pose[2, 0:3]))
+        np.negative(pose[2, 0:3], out=self._gravity)
+        np.copyto(self._grav_comp_torque.ravel(), self._kin.get_grav_comp_efforts(self._fbk.position, self._gravity))
 
         np.multiply(soft_start, self._impedance_torque, out=self._joint_efforts)
         np.add(self._joint_efforts, self._grav_comp_torque, out=self._joint_efforts)
@@ -10,6 +10,7 @@ from .configuration import Igor2Config
 from math import atan2, degrees, radians
 from time import sleep, time
 from util import math_utils
+from util.realtime_utils import lock_memory, set_thread_realtime
 
 import hebi
 import sys
@@ -819,6 +820,9 @@ class Igor(object):
                 start_condition.notify_all()
                 start_condition.release()
 
+                # Best effort, only applies when running with enough privileges
+                lock_memory()
+                set_thread_realtime()
                 self._start()
 
             self._proc_thread = Thread(target=start_routine,
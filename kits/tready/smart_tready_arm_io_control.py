@@ -89,17 +89,22 @@ def setup_mobile_io(m: 'MobileIO'):
         if m.update(0.0):
             if m.get_button_state(quit_demo_btn):
                 return True, None, None
+
+            # Each of these is used several times below, read them once
+            torque_mode = m.get_button_state(torque_btn)
+            torque_diff = m.get_button_diff(torque_btn)
+
             if m.get_button_state(reset_pose_btn):
-                return False, TreadyInputs(home=True, torque_mode=m.get_button_state(torque_btn), torque_toggle=abs(m.get_button_diff(torque_btn))), ArmMobileIOInputs(home=True)
+                return False, TreadyInputs(home=True, torque_mode=torque_mode, torque_toggle=abs(torque_diff)), ArmMobileIOInputs(home=True)
             
-            if m.get_button_diff(torque_btn) == 1:
+            if torque_diff == 1:
                 change_to_torque_mode(m)
-            elif m.get_button_diff(torque_btn) == -1:
+            elif torque_diff == -1:
                 change_to_velocity_mode(m)
             
             tready_inputs = None
             if m.get_button_state(recenter_btn):
-                tready_inputs = TreadyInputs(align_flippers=True, torque_mode=m.get_button_state(torque_btn), torque_toggle=abs(m.get_button_diff(torque_btn)))
+                tready_inputs = TreadyInputs(align_flippers=True, torque_mode=torque_mode, torque_toggle=abs(torque_diff))
             else:
                 chassis_velocity = ChassisVelocity(
                     m.get_axis_state(forward_joy),
@@ -121,8 +126,8 @@ def setup_mobile_io(m: 'MobileIO'):
                 tready_inputs = TreadyInputs(
                     base_motion=chassis_velocity,
                     flippers=flippers,
-                    torque_mode=m.get_button_state(torque_btn),
-                    torque_toggle=abs(m.get_button_diff(torque_btn))
+                    torque_mode=torque_mode,
+                    torque_toggle=abs(torque_diff)
                 )
 
             try:
@@ -131,17 +136,19 @@ def setup_mobile_io(m: 'MobileIO'):
                 print(f'Error getting orientation as matrix: {e}\n{m.orientation}')
                 rotation = np.eye(3)
 
-            if m.get_button_diff(arm_lock) != 0:
-                if not m.get_button_state(arm_lock):
+            arm_unlocked = m.get_button_state(arm_lock)
+            arm_lock_toggled = m.get_button_diff(arm_lock) != 0
+            if arm_lock_toggled:
+                if not arm_unlocked:
                     m.set_button_label(arm_lock, 'Arm 🔒', blocking=False)
-                elif m.get_button_state(arm_lock):
+                else:
                     m.set_button_label(arm_lock, 'Arm 🔓', blocking=False)
 
             arm_inputs = ArmMobileIOInputs(
                 np.copy(m.position),
                 rotation,
-                bool(m.get_button_diff(arm_lock) != 0),
-                not m.get_button_state(arm_lock),
+                arm_lock_toggled,
+                not arm_unlocked,
                 m.get_button_state(gripper_close)
             )
             
@@ -46,7 +46,7 @@ class TreadedBase:
         self.group = group
 
         self.fbk = self.group.get_next_feedback()
-        while self.fbk == None:
+        while self.fbk is None:
             self.fbk = self.group.get_next_feedback()
 
         self.wheel_fbk = self.fbk.create_view([0, 1, 2, 3])
@@ -68,6 +68,11 @@ class TreadedBase:
 
         self.chassis_traj = None
         self.flipper_traj = None
+        # Waypoint buffers reused whenever a trajectory is replanned.
+        # create_trajectory copies its inputs, so they can be overwritten
+        # as soon as the new trajectory exists.
+        self._flipper_waypoints = np.empty((3, 4, 2), dtype=np.float64)
+        self._chassis_waypoints = np.empty((3, 3, 2), dtype=np.float64)
 
         self.robot_model = None
     
@@ -199,9 +204,7 @@ class TreadedBase:
 
     def set_flipper_trajectory(self, t_now: float, ramp_time: float, p=None, v=None):
         times = [t_now, t_now + ramp_time]
-        positions = np.empty((4, 2), dtype=np.float64)
-        velocities = np.empty((4, 2), dtype=np.float64)
-        accelerations = np.empty((4, 2), dtype=np.float64)
+        positions, velocities, accelerations = self._flipper_waypoints
 
         if self.flipper_traj is not None:
             t = min(t_now, self.flipper_traj.end_time)
@@ -219,9 +222,7 @@ class TreadedBase:
 
     def set_chassis_vel_trajectory(self, t_now: float, ramp_time: float, v):
         times = [t_now, t_now + ramp_time]
-        positions = np.empty((3, 2))
-        velocities = np.empty((3, 2))
-        efforts = np.empty((3, 2))
+        positions, velocities, efforts = self._chassis_waypoints
 
         if self.chassis_traj is not None:
             t = min(t_now, self.chassis_traj.end_time)
@@ -308,6 +309,15 @@ class TreadyControl:
         # Variable for torque mode update handler
         self.torque_labels = None
 
+        # Preallocated buffers for the torque mode flipper command
+        self._flipper_efforts = np.zeros(4)
+        self._flipper_nan_cmd = np.full(4, np.nan)
+
+        # Slider to flipper velocity gains, and the velocity targets they are applied into
+        self._flipper_vel_gains = -self.FLIPPER_VEL_SCALE * base.flipper_sign
+        self._flipper_vels = np.zeros(4)
+        self._chassis_vels = np.zeros(3)
+
     @property
     def running(self):
         return self.state is not self.state.EXIT
@@ -395,10 +405,17 @@ class TreadyControl:
                         pitch_torque = np.array([0, 0, 1, -1]) * pitch_angle * self.base.TORSO_TORQUE_SCALE * pitch_adjust
                     
                     level_torque = roll_torque + pitch_torque
-                    flipper_efforts = -np.tanh(self.base.flipper_fbk.position - self.base.flipper_sign * torque_angle) * torque_max + level_torque
+
+                    # -tanh(position - sign * angle) * max + level, computed in place
+                    flipper_efforts = self._flipper_efforts
+                    np.multiply(self.base.flipper_sign, torque_angle, out=flipper_efforts)
+                    np.subtract(self.base.flipper_fbk.position, flipper_efforts, out=flipper_efforts)
+                    np.tanh(flipper_efforts, out=flipper_efforts)
+                    flipper_efforts *= -torque_max
+                    flipper_efforts += level_torque
 
                     self.base.flipper_traj = None
-                    self.base.set_flipper_cmd(p=np.ones(4) * np.nan, v = np.ones(4) * np.nan, e=flipper_efforts)
+                    self.base.set_flipper_cmd(p=self._flipper_nan_cmd, v=self._flipper_nan_cmd, e=flipper_efforts)
 
                     self.torque_labels = [
                         f"Max\nEff:\n{np.round(torque_max, 2)}",
@@ -408,20 +425,19 @@ class TreadyControl:
                     ]
                 else:
                     # Flipper Control
-                    flipper_vels = - self.base.flipper_sign * tready_input.flippers * self.FLIPPER_VEL_SCALE
+                    flipper_vels = self._flipper_vels
+                    np.multiply(tready_input.flippers, self._flipper_vel_gains, out=flipper_vels)
 
                     if tready_input.torque_toggle:
-                        self.base.set_flipper_cmd(p=self.base.flipper_fbk.position, e=np.ones(4) * np.nan)
+                        self.base.set_flipper_cmd(p=self.base.flipper_fbk.position, e=self._flipper_nan_cmd)
                     self.base.set_flipper_trajectory(t_now, self.base.flipper_ramp_time, v=flipper_vels)
 
                     self.torque_labels = None
                 
                 # Mobile Base Control
-                chassis_vels: 'npt.NDArray[np.float64]' = np.array([
-                    self.SPEED_MAX_LIN * tready_input.base_motion.x,
-                    0,
-                    self.SPEED_MAX_ROT * tready_input.base_motion.rz
-                ], dtype=np.float64)
+                chassis_vels = self._chassis_vels
+                chassis_vels[0] = self.SPEED_MAX_LIN * tready_input.base_motion.x
+                chassis_vels[2] = self.SPEED_MAX_ROT * tready_input.base_motion.rz
 
                 self.base.set_chassis_vel_trajectory(t_now, self.base.chassis_ramp_time, chassis_vels)
         
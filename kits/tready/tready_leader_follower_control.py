@@ -1,6 +1,6 @@
 import sys
 import os
-from time import time, sleep
+from time import monotonic, time, sleep
 from .tready import TreadyControl, TreadyControlState, config_mobile_io
 
 from advanced.demos.MAPS_control.gripper_control import GripperControl
@@ -170,6 +170,8 @@ if __name__ == "__main__":
     last_text_update = 0.0
     while demo_controller.running and gripper_control.running and leader_follower_control.running:
         t = time()
+        # the MAPS controllers keep time on the monotonic clock
+        t_maps = monotonic()
         demo_inputs = None
         if m_tready.update(0.0):
             demo_inputs = input_parser(m_tready)
@@ -178,16 +180,16 @@ if __name__ == "__main__":
 
         try:
             demo_controller.update(t, demo_inputs)
-            leader_follower_control.update(t, arm_inputs)
-            gripper_control.update(t, gripper_inputs)
+            leader_follower_control.update(t_maps, arm_inputs)
+            gripper_control.update(t_maps, gripper_inputs)
 
             demo_controller.send()
             leader_follower_control.send()
             gripper_control.send()
 
             if leader_follower_control.state == LeaderFollowerControlState.UNALIGNED:
-                if t - last_text_update > 0.1:
-                    last_text_update = t
+                if t_maps - last_text_update > 0.1:
+                    last_text_update = t_maps
                     m.clear_text()
                     m.add_text(f'Unaligned: {np.around(np.rad2deg(leader_follower_control.angle_diff), decimals=0)}')
 
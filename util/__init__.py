@@ -1 +1 @@
-__all__ = ['math_utils', 'type_utils']
+__all__ = ['math_utils', 'realtime_utils', 'type_utils']
@@ -0,0 +1,64 @@
+import os
+import sys
+
+
+def set_thread_realtime(priority=50, cpu=None):
+    """Best effort: run the calling thread with ``SCHED_FIFO`` priority,
+    pinned to a single core.
+
+    Only available on Linux, and requires ``CAP_SYS_NICE`` (e.g., running as root).
+    Does nothing otherwise.
+
+    :param priority: ``SCHED_FIFO`` priority (1-99)
+    :type priority:  int
+    :param cpu: Core to pin the thread to. Defaults to the highest numbered
+                core the thread is allowed to run on.
+    :type cpu:  int, NoneType
+
+    :return: ``True`` if the scheduling policy was applied
+    :rtype:  bool
+    """
+    if not hasattr(os, 'sched_setscheduler'):
+        return False
+
+    try:
+        # pid 0 refers to the calling thread
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except OSError:
+        return False
+
+    # Only pin once the priority is in place, so an unprivileged thread is
+    # never left confined to one core at normal priority
+    try:
+        if cpu is None:
+            # the highest numbered core is the least likely to be servicing interrupts
+            cpu = max(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        pass
+    return True
+
+
+def lock_memory():
+    """Best effort: lock all current and future pages of the process in RAM,
+    so that the control loop never stalls on a page fault.
+
+    Only available on Linux, and requires ``CAP_IPC_LOCK`` (e.g., running as root).
+    Does nothing otherwise.
+
+    :return: ``True`` if the memory was locked
+    :rtype:  bool
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+
+    import ctypes
+    import ctypes.util
+
+    MCL_CURRENT = 1
+    MCL_FUTURE = 2
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        return libc.mlockall(MCL_CURRENT | MCL_FUTURE) == 0
+    except (OSError, AttributeError):
+        return False